@@ -1,7 +1,19 @@
-from importlib.metadata import version
+from typing import Any
 
-from .formatting import format_msort
 from .msort_decorator import msort_group
 
 __PROJECT_NAME__ = "msort"
-__version__ = version(__PROJECT_NAME__)
+
+
+def __getattr__(name: str) -> Any:
+    # format_msort pulls in libcst which is not needed by code which only uses msort_group
+    if name == "format_msort":
+        from .formatting import format_msort  # pylint: disable=import-outside-toplevel
+
+        return format_msort
+    # only look up the version when it is asked for
+    if name == "__version__":
+        from importlib.metadata import version  # pylint: disable=import-outside-toplevel
+
+        return version(__PROJECT_NAME__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
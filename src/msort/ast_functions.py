@@ -1,28 +1,19 @@
 """Functions for handling AST parsed class components"""
 import ast
-from collections import OrderedDict
-from copy import deepcopy
 from typing import Callable
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
-import ast_comments
-import astor
-
 from .configs import DUNDER_PATTERN
 from .configs import find_classes_response
 from .configs import ordered_methods_type
 from .decorators import get_decorators
 from .edge_cases import handle_edge_cases
-from .generic_functions import is_class_method
-from .generic_functions import is_getter
-from .generic_functions import is_msort_group
-from .generic_functions import is_property
-from .generic_functions import is_setter
-from .generic_functions import is_static_method
 from .imports import handle_import_formatting
+from .utilities import extract_text_from_file
 from .utilities import is_class_docstring
 from .utilities import is_ellipsis
 from .utilities import merge_code_strings
@@ -101,10 +92,13 @@ def parse_code(code: Optional[str] = None, file_path: Optional[str] = None) -> a
     Raises:
         ValueError: if code and file_path are both None
     """
+    # ast_comments is only imported when code is parsed rather than whenever this module is imported
     if code is not None:
+        import ast_comments  # pylint: disable=import-outside-toplevel
+
         return ast_comments.parse(code)
     if file_path is not None:
-        return astor.parse_file(file_path)
+        return ast.parse(extract_text_from_file(file_path), filename=file_path)
     raise ValueError("Must provide code or file_path!")
 
 
@@ -282,11 +276,22 @@ def is_decorated(expression: ast.stmt) -> bool:
     return True
 
 
+_msortable_checks: Tuple[Callable[[ast.AST], bool], ...] = (
+    is_class,
+    is_function,
+    is_ellipsis,
+    is_annotated_class_attribute,
+    is_class_attribute,
+    is_class_docstring,
+)
+
+
 def is_msortable(expression: ast.AST) -> bool:
     """
     Determine if the ast parsed expression is sortable by msort
 
-    Defines a list of checks and if any of the checks evaluate as True, then the expression can be sorted.
+    Runs through a fixed sequence of checks and if any of the checks evaluate as True, then the expression can be
+    sorted.
 
     Args:
         expression: the ast parsed expression
@@ -295,34 +300,7 @@ def is_msortable(expression: ast.AST) -> bool:
         True if the expression is sortable
 
     """
-    checks = [
-        is_class,
-        is_function,
-        is_ellipsis,
-        is_annotated_class_attribute,
-        is_class_attribute,
-        is_class_docstring,
-    ]
-    return any(func(expression) for func in checks)
-
-
-method_checking_map: Dict[Callable, int] = OrderedDict(
-    [
-        (is_ellipsis, 0),
-        (is_class_docstring, 0),
-        (is_annotated_class_attribute, 1),
-        (is_class_attribute, 2),
-        (is_dunder_method, 3),
-        (is_msort_group, 4),
-        (is_class_method, 5),
-        (is_static_method, 6),
-        (is_property, 7),
-        (is_getter, 8),
-        (is_setter, 9),
-        (is_decorated, 10),
-        (is_private_method, 12),
-    ]
-)
+    return any(func(expression) for func in _msortable_checks)
 
 
 def preserve_comments(parsed_code: ast.Module) -> str:
@@ -337,9 +315,17 @@ def preserve_comments(parsed_code: ast.Module) -> str:
     Returns:
         new_code: merged code from astor and ast_comments parsers
     """
-    uncommented_code = deepcopy(parsed_code)
-    uncommented_code = remove_comment_nodes(uncommented_code)
-    astor_code = astor.to_source(uncommented_code)
+    import ast_comments  # pylint: disable=import-outside-toplevel
+    import astor  # pylint: disable=import-outside-toplevel
+
     new_code = ast_comments.unparse(parsed_code)
+    # strip the comments in place for astor and put them back afterwards
+    removed: List[Tuple[List[ast.stmt], List[ast.stmt]]] = []
+    remove_comment_nodes(parsed_code, removed)
+    try:
+        astor_code = astor.to_source(parsed_code)
+    finally:
+        for body, original in removed:
+            body[:] = original
     new_code = merge_code_strings(astor_code, new_code)
     return new_code
@@ -22,6 +22,9 @@ CLASS_SPACING: Final[str] = "\n\n\n"
 # Default name for a docstring expression
 DOCSTRING_NAME: Final[str] = "docstring"
 
+# Default name for an ellipsis expression parsed with libcst
+ELLIPSIS_NAME: Final[str] = "ellipsis"
+
 # Name of ini config file
 DEFAULT_CONFIG_INI_FILE_NAME: Final[str] = "msort.ini"
 
@@ -37,6 +40,15 @@ DEFAULT_MSORT_ORDERING_SECTION: Final[str] = f"msort.{DEFAULT_MSORT_ORDERING_SUB
 # Name of other msort params config section
 DEFAULT_MSORT_PARAMS_SECTION: Final[str] = "msort"
 
+# number of bytes to request per read when a file is not read in a single call
+READ_CHUNK_SIZE: Final[int] = 1 << 16
+
+# minimum number of scripts before formatting is distributed across forked worker processes
+MIN_SCRIPTS_FOR_MULTIPROCESSING: Final[int] = 8
+
+# minimum number of scripts before formatting is distributed across spawned worker processes which start much slower
+MIN_SCRIPTS_FOR_SPAWNED_WORKERS: Final[int] = 128
+
 # Default config file parameters
 DEFAULT_MSORT_ORDER_PARAMS: Final[Dict[str, Any]] = {
     "dunder_method": 3,
@@ -1,9 +1,11 @@
 """Functions for handling CST parsed class components"""
 from typing import Any
+from typing import Callable
 from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Sequence
+from typing import Tuple
 from typing import Union
 
 import libcst
@@ -79,7 +81,7 @@ def parse_code(code: Optional[str] = None, file_path: Optional[str] = None) -> l
     Raises:
         ValueError: if code and file_path are both None
     """
-    if file_path is not None:
+    if code is None and file_path is not None:
         code = extract_text_from_file(file_path)
     if code is not None:
         return libcst.parse_module(code)
@@ -287,11 +289,22 @@ def is_decorated(expression: libcst.CSTNode) -> bool:
     return True
 
 
+_msortable_checks: Tuple[Callable[[libcst.CSTNode], bool], ...] = (
+    is_class,
+    is_function,
+    is_ellipsis_cst,
+    is_annotated_class_attribute,
+    is_class_attribute,
+    is_class_docstring_cst,
+)
+
+
 def is_msortable(expression: libcst.CSTNode) -> bool:
     """
     Determine if the ast parsed expression is sortable by msort
 
-    Defines a list of checks and if any of the checks evaluate as True, then the expression can be sorted.
+    Runs through a fixed sequence of checks and if any of the checks evaluate as True, then the expression can be
+    sorted.
 
     Args:
         expression: the ast parsed expression
@@ -300,12 +313,4 @@ def is_msortable(expression: libcst.CSTNode) -> bool:
         True if the expression is sortable
 
     """
-    checks = [
-        is_class,
-        is_function,
-        is_ellipsis_cst,
-        is_annotated_class_attribute,
-        is_class_attribute,
-        is_class_docstring_cst,
-    ]
-    return any(func(expression) for func in checks)
+    return any(func(expression) for func in _msortable_checks)
@@ -2,11 +2,12 @@
 Command line entrypoint
 """
 import argparse
-import ast
 import importlib
 import logging
-import re
-from pathlib import Path
+import multiprocessing
+import os
+import stat
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 from typing import Dict
 from typing import List
@@ -18,9 +19,17 @@ from .config_loader import get_config_loader
 from .configs import DEFAULT_MSORT_ORDERING_SECTION
 from .configs import DEFAULT_MSORT_PARAMS_SECTION
 from .configs import format_msort_response
+from .configs import MIN_SCRIPTS_FOR_MULTIPROCESSING
+from .configs import MIN_SCRIPTS_FOR_SPAWNED_WORKERS
 from .formatting import format_msort
 from .logger import set_logging
 from .method_describers import get_method_describer
+from .method_describers import MethodDescriber
+from .utilities import compile_skip_matcher
+from .utilities import str_to_bool
+
+# per process state used by _format_one - populated by _init_format_worker
+_worker_state: Dict[str, Any] = {}
 
 
 def parse_commandline() -> Tuple[argparse.Namespace, Dict[str, Any]]:
@@ -110,7 +119,7 @@ def parse_commandline() -> Tuple[argparse.Namespace, Dict[str, Any]]:
 
 
 def _validate_paths_input_file(
-    input_path: Path, output_path: Optional[Path] = None, check_only: bool = False
+    input_path: str, output_path: Optional[str] = None, check_only: bool = False
 ) -> Tuple[List[str], List[Optional[str]]]:
     """
     Validate that the input file path and output path are compatible when the user has specified a specific input file
@@ -123,22 +132,22 @@ def _validate_paths_input_file(
         py_scripts: list of paths to .py scripts for formatting
         outputs: list of paths where formatted scripts will be written to
     """
-    py_scripts = [input_path.as_posix()]
+    py_scripts = [input_path]
     outputs: List[Optional[str]]
     if check_only:
         outputs = [None] * len(py_scripts)
     elif output_path is None:
-        outputs = [input_path.as_posix()]
-    elif output_path.as_posix().endswith(".py"):
-        outputs = [output_path.as_posix()]
+        outputs = [input_path]
+    elif output_path.endswith(".py"):
+        outputs = [output_path]
     else:
-        logging.info("Treating output path %s as a directory!", output_path.as_posix())
-        outputs = [output_path.joinpath(input_path.name).as_posix()]
+        logging.info("Treating output path %s as a directory!", output_path)
+        outputs = [os.path.join(output_path, os.path.basename(input_path))]
     return py_scripts, outputs
 
 
 def _validate_paths_input_dir(
-    input_path: Path, output_path: Optional[Path] = None, check_only: bool = False
+    input_path: str, output_path: Optional[str] = None, check_only: bool = False
 ) -> Tuple[List[str], List[Optional[str]]]:
     """
     Validate that the input file path and output path are compatible when the user has specified an input directory
@@ -151,17 +160,34 @@ def _validate_paths_input_dir(
         py_scripts: list of paths to .py scripts for formatting
         outputs: list of paths where formatted scripts will be written to
     """
-    py_scripts = [script.as_posix() for script in input_path.rglob(pattern="*.py")]
-    outputs: List[Optional[str]]
-    if check_only:
-        outputs = [None] * len(py_scripts)
-    elif output_path is None:
-        outputs = list(py_scripts)
-    elif output_path.as_posix().endswith(".py"):
+    if output_path is not None and not check_only and output_path.endswith(".py"):
         raise ValueError("Input path is a directory but output path is a .py file!")
-    else:
-        logging.info("Treating output path %s as a directory!", output_path.as_posix())
-        outputs = [output_path.joinpath(Path(script).name).as_posix() for script in py_scripts]
+    output_dir = None if check_only or output_path is None else output_path
+    if output_dir is not None:
+        logging.info("Treating output path %s as a directory!", output_dir)
+
+    py_scripts: List[str] = []
+    outputs: List[Optional[str]] = []
+    # like Path.rglob, symlinked .py files are included, symlinked directories are not followed and unreadable
+    # directories are skipped
+    directories = [input_path]
+    while directories:
+        try:
+            entries = os.scandir(directories.pop())
+        except PermissionError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    directories.append(entry.path)
+                elif entry.name.endswith(".py") and entry.is_file():
+                    py_scripts.append(entry.path)
+                    if check_only:
+                        outputs.append(None)
+                    elif output_dir is None:
+                        outputs.append(entry.path)
+                    else:
+                        outputs.append(os.path.join(output_dir, entry.name))
     return py_scripts, outputs
 
 
@@ -190,19 +216,18 @@ def validate_paths(
         return files, output_files
     if input_path is None:
         raise ValueError("Must provide an input path if positional args 'files' is None!")
-    input_pure_path = Path(input_path)
-    output_pure_path = Path(output_path) if output_path is not None else None
-
-    if not input_pure_path.exists():
-        raise FileNotFoundError("Input path does not exist!")
+    try:
+        mode = os.stat(input_path).st_mode
+    except (FileNotFoundError, NotADirectoryError) as e:
+        raise FileNotFoundError("Input path does not exist!") from e
 
     if check_only and output_path is not None:
         logging.warning("Overriding output path as running in check only mode!")
 
-    if input_pure_path.is_file():
-        py_scripts, outputs = _validate_paths_input_file(input_pure_path, output_pure_path, check_only)
-    elif input_pure_path.is_dir():
-        py_scripts, outputs = _validate_paths_input_dir(input_pure_path, output_pure_path, check_only)
+    if stat.S_ISREG(mode):
+        py_scripts, outputs = _validate_paths_input_file(input_path, output_path, check_only)
+    elif stat.S_ISDIR(mode):
+        py_scripts, outputs = _validate_paths_input_dir(input_path, output_path, check_only)
     else:
         raise ValueError("Input path is neither a file or a directory! ")
     return py_scripts, outputs
@@ -236,11 +261,11 @@ def update_config_general(cfg: Dict[str, Any], args: Dict[str, Any]) -> Dict[str
         cfg: updated if necessary by command line arguments
     """
     for param in cfg[DEFAULT_MSORT_PARAMS_SECTION]:
-        possible_params = [param, param.replace("_", "-"), f"n_{param}", f"n-{param.replace('_', '-')}"]
-        for p in possible_params:
+        dashed_param = param.replace("_", "-")
+        for p in (param, dashed_param, f"n_{param}", f"n-{dashed_param}"):
             if p in args:
                 value: str = args[p]
-                value = (not re.match(r"^n[-_]", p)) if value is None else value
+                value = (not p.startswith(("n-", "n_"))) if value is None else value
                 logging.info("Overriding %s : set to %s", param, value)
                 cfg[DEFAULT_MSORT_PARAMS_SECTION][param] = str(value)
     return cfg
@@ -261,6 +286,77 @@ def update_config(cfg: Dict[str, Any], args: Dict[str, Any]) -> Dict[str, Any]:
     return cfg
 
 
+def _available_cpus() -> int:
+    """
+    Get the number of CPUs this process is allowed to run on.
+
+    os.sched_getaffinity respects CPU affinity and cpuset limits but is not available on every platform.
+    Returns:
+        number of usable CPUs
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _min_scripts_for_multiprocessing() -> int:
+    """
+    Get the minimum number of scripts for which starting worker processes is worthwhile.
+
+    Returns:
+        minimum number of scripts for the default process start method
+    """
+    if multiprocessing.get_start_method() == "fork":
+        return MIN_SCRIPTS_FOR_MULTIPROCESSING
+    return MIN_SCRIPTS_FOR_SPAWNED_WORKERS
+
+
+def _init_format_worker(
+    parser_type: str,
+    method_describer: MethodDescriber,
+    auto_static: bool,
+    use_property_groups: bool,
+    verbosity: int,
+) -> None:
+    """
+    Set up the state needed by _format_one in the current process.
+
+    Parser modules cannot be pickled so the parser is imported by name in each worker process. Logging is configured
+    again because workers started with spawn or forkserver do not inherit the logging set up of the main process.
+    Args:
+        parser_type: name of the code parser - either ast or cst
+        method_describer: instance of MethodDescriber for classifying methods of classes
+        auto_static: If True, then static methods without the @staticmethod decorator will be marked as static
+        use_property_groups: If True, then methods related to a property will be grouped together
+        verbosity: requested verbosity level
+    """
+    set_logging(verbosity)
+    _worker_state["parser"] = importlib.import_module(f"{__PROJECT_NAME__}.{parser_type}_functions")
+    _worker_state["method_describer"] = method_describer
+    _worker_state["auto_static"] = auto_static
+    _worker_state["use_property_groups"] = use_property_groups
+
+
+def _format_one(job: Tuple[str, Optional[str]]) -> format_msort_response:
+    """
+    Run msort on a single script using the state set up by _init_format_worker
+    Args:
+        job: path to the input script and path to write the formatted script to
+
+    Returns:
+        response from format_msort
+    """
+    input_script, output_script = job
+    return format_msort(
+        file_path=input_script,
+        output_py=output_script,
+        parser=_worker_state["parser"],
+        method_describer=_worker_state["method_describer"],
+        auto_static=_worker_state["auto_static"],
+        use_property_groups=_worker_state["use_property_groups"],
+    )
+
+
 def main() -> None:
     params, args = parse_commandline()
     set_logging(params.verbose)
@@ -279,42 +375,52 @@ def main() -> None:
         logging.info("Checking %s python scripts ...", len(py_scripts))
 
     logging.info("Using the %s parser!", str.upper(params.parser))
-    code_parser = importlib.import_module(f"msort.{params.parser}_functions")
     config_loader = get_config_loader(config_path=params.config_path)
     cfg = config_loader.config
 
     # command line can be used to override some options
-    auto_static_param = cfg[DEFAULT_MSORT_PARAMS_SECTION]["auto_static"]
-    auto_static = ast.literal_eval(auto_static_param) if isinstance(auto_static_param, str) else auto_static_param
-    auto_static = True if "auto-static" in args else auto_static
-    auto_static = False if "n-auto-static" in args else auto_static
-    property_groups_param = cfg[DEFAULT_MSORT_PARAMS_SECTION]["use_property_groups"]
-    property_groups = (
-        ast.literal_eval(property_groups_param) if isinstance(property_groups_param, str) else property_groups_param
-    )
-    property_groups = True if "property_groups" in args else property_groups
-    property_groups = False if "n-property_groups" in args else property_groups
+    # the negated flag takes precedence and the config value is only parsed if neither flag was used
+    if "n-auto-static" in args:
+        auto_static = False
+    elif "auto-static" in args:
+        auto_static = True
+    else:
+        auto_static = str_to_bool(cfg[DEFAULT_MSORT_PARAMS_SECTION]["auto_static"])
+    if "n-property_groups" in args:
+        property_groups = False
+    elif "property_groups" in args:
+        property_groups = True
+    else:
+        property_groups = str_to_bool(cfg[DEFAULT_MSORT_PARAMS_SECTION]["use_property_groups"])
 
     cfg = update_config(cfg, args)
 
     # instantiate method describer
     method_describer = get_method_describer(parser_type=params.parser, config=cfg, override_level_check=params.force)
 
-    responses: List[format_msort_response] = []
+    is_skipped = compile_skip_matcher(skip_patterns)
+    jobs: List[Tuple[str, Optional[str]]] = []
     for input_script, output_script in zip(py_scripts, outputs):
-        if any(skip_pat in Path(input_script).stem for skip_pat in skip_patterns):
+        if is_skipped(os.path.splitext(os.path.basename(input_script))[0]):
             logging.debug("Skipping %s", input_script)
             continue
         logging.debug("Reformatting %s ...", input_script)
-        response = format_msort(
-            file_path=input_script,
-            output_py=output_script,
-            parser=code_parser,
-            method_describer=method_describer,
-            auto_static=auto_static,
-            use_property_groups=property_groups,
-        )
-        responses.append(response)
+        jobs.append((input_script, output_script))
+
+    responses: List[format_msort_response]
+    n_workers = min(_available_cpus(), len(jobs))
+    if n_workers <= 1 or len(jobs) < _min_scripts_for_multiprocessing():
+        _init_format_worker(params.parser, method_describer, auto_static, property_groups, params.verbose)
+        responses = [_format_one(job) for job in jobs]
+    else:
+        # several chunks per worker keeps the workers evenly loaded when some scripts take longer than others
+        chunksize = max(1, len(jobs) // (n_workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_init_format_worker,
+            initargs=(params.parser, method_describer, auto_static, property_groups, params.verbose),
+        ) as executor:
+            responses = list(executor.map(_format_one, jobs, chunksize=chunksize))
     n = sum(resp["code"] for resp in responses)
     if params.check:
         logging.info(
@@ -3,7 +3,6 @@ import configparser
 import logging
 from abc import ABC
 from abc import abstractmethod
-from collections import OrderedDict
 from typing import Any
 from typing import Callable
 from typing import Dict
@@ -27,6 +26,7 @@ from .utilities import is_class_docstring
 from .utilities import is_class_docstring_cst
 from .utilities import is_ellipsis
 from .utilities import is_ellipsis_cst
+from .utilities import str_to_bool
 
 
 class MethodDescriber(ABC):
@@ -40,6 +40,8 @@ class MethodDescriber(ABC):
                                 If True, then the exception is replaced with a warning.
         _config_to_func_map: a mapping from config keys to the appropriate function
         _method_checking_map: a mapping of a function to an ordering level
+        _method_checks: the items of _method_checking_map in ordering level order
+        _method_checks_no_group: _method_checks without the msort_group check
     """
 
     def __init__(self, config: configparser.ConfigParser, override_level_check: bool = False) -> None:
@@ -47,6 +49,10 @@ class MethodDescriber(ABC):
         self._override_level_check = override_level_check
         self._config_to_func_map: Dict[str, Callable] = self._setup_config_to_func_map()
         self._method_checking_map: Dict[Callable, int] = self._setup_func_to_level_map()
+        self._method_checks: Tuple[Tuple[Callable, int], ...] = tuple(self._method_checking_map.items())
+        self._method_checks_no_group: Tuple[Tuple[Callable, int], ...] = tuple(
+            (func, level) for func, level in self._method_checks if func.__name__ != "is_msort_group"
+        )
         self._instance_method_default: int = INSTANCE_METHOD_LEVEL
 
     @staticmethod
@@ -69,7 +75,7 @@ class MethodDescriber(ABC):
             True if msort should consider the msort_group decorator
         """
         param = self._config[DEFAULT_MSORT_PARAMS_SECTION]["use_msort_group"]
-        return ast.literal_eval(param) if isinstance(param, str) else param
+        return str_to_bool(param)
 
     @abstractmethod
     def _setup_config_to_func_map(self) -> Dict[str, Callable]:
@@ -102,9 +108,7 @@ class MethodDescriber(ABC):
         """
         if not self._validate_node(method):
             raise TypeError(f"Node of type {type(method)} cannot be used!")
-        for func, level in self._method_checking_map.items():
-            if func.__name__ == "is_msort_group" and not use_msort_group:
-                continue
+        for func, level in self._method_checks if use_msort_group else self._method_checks_no_group:
             if func(method):
                 return level
         return self._instance_method_default
@@ -116,9 +120,9 @@ class MethodDescriber(ABC):
         1) Fixed defaults are added
         2) User defined ordering levels from the config file are added
         3) Any node types missing from the config are added using default values
-        4) Sort the mapping according to ordering level and put into OrderedDict
+        4) Sort the mapping according to ordering level and put into an insertion ordered dict
         Returns:
-            func_to_value_map: OrderedDict with node classifying functions as keys and ordering levels as values
+            func_to_value_map: dict with node classifying functions as keys and ordering levels as values
 
         Raises:
             ValueError: if max user defined sorting level is >= to a fixed default sorting level and
@@ -154,14 +158,17 @@ class MethodDescriber(ABC):
         mapping.extend([(self._config_to_func_map[method], int(value)) for method, value in configs.items()])
 
         # check if need to add any defaults
+        present = {t[0] for t in mapping}
         for method_type, value in DEFAULT_MSORT_ORDER_PARAMS.items():
             if method_type == "instance_method":
                 continue
-            if self._config_to_func_map[method_type] not in map(lambda t: t[0], mapping):
+            func = self._config_to_func_map[method_type]
+            if func not in present:
                 logging.info("Using default level %s for %s", value, method_type)
-                mapping.append((self._config_to_func_map[method_type], value))
+                mapping.append((func, value))
+                present.add(func)
         mapping = sorted(mapping, key=lambda t: t[1])
-        func_to_value_map: Dict[Callable, int] = OrderedDict(mapping)
+        func_to_value_map: Dict[Callable, int] = dict(mapping)
 
         return func_to_value_map
 
@@ -1,24 +1,28 @@
 import ast
-import logging
+import configparser
 import os
+import re
 from pathlib import Path
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import Final
+from typing import List
+from typing import Optional
+from typing import Tuple
 from typing import TypeVar
 from typing import Union
 
-import ast_comments
-import astor
 import libcst
 
 from .configs import DOCSTRING_NAME
+from .configs import ELLIPSIS_NAME
+from .configs import READ_CHUNK_SIZE
 from .configs import Node
 
 
 T = TypeVar("T")
 
-
 def check_and_get_attribute(obj: T, attribute: str, raise_exception: bool = False) -> Any:
     output = hasattr(obj, attribute)
     if not output and raise_exception:
@@ -26,6 +30,51 @@ def check_and_get_attribute(obj: T, attribute: str, raise_exception: bool = Fals
     return getattr(obj, attribute, None)
 
 
+def str_to_bool(value: Union[str, bool, int]) -> bool:
+    """
+    Convert a boolean config value to a bool.
+
+    Values loaded from .ini files or the command line are strings whereas values from .toml files are already bools
+    or ints. Strings are matched case-insensitively against the same values as configparser e.g. True, false, yes, 1
+
+    Args:
+        value: the config value
+
+    Returns:
+        value as a bool
+
+    Raises:
+        ValueError: if the value does not represent a boolean
+    """
+    if isinstance(value, int):
+        # bool is a subclass of int so this covers both
+        return bool(value)
+    if not isinstance(value, str):
+        raise ValueError(f"Cannot interpret {value} as a boolean!")
+    try:
+        return configparser.ConfigParser.BOOLEAN_STATES[value.strip().lower()]
+    except KeyError as e:
+        raise ValueError(f"Cannot interpret {value} as a boolean!") from e
+
+
+def compile_skip_matcher(patterns: List[str]) -> Callable[[str], bool]:
+    """
+    Build a function which checks whether a script name contains any of the skip patterns
+
+    The patterns are combined into a single alternation regex so every pattern is checked in one pass over the name.
+
+    Args:
+        patterns: substrings which indicate that a script should be skipped
+
+    Returns:
+        function returning True if the supplied name contains any of the patterns
+    """
+    if not patterns:
+        return lambda name: False
+    skip_re = re.compile("|".join(map(re.escape, patterns)))
+    return lambda name: skip_re.search(name) is not None
+
+
 def extract_text_from_file(file_path: str) -> str:
     """
     Load text from a file
@@ -35,8 +84,32 @@ def extract_text_from_file(file_path: str) -> str:
     Returns:
         python_code: code from the file
     """
-    with open(file_path, "r", encoding="utf-8") as f:
-        python_code = f.read()
+    return _read_text(file_path, os.stat(file_path).st_size)
+
+
+def _read_text(file_path: str, size: int) -> str:
+    """
+    Read utf-8 text from a file with universal newlines
+    Args:
+        file_path: path to file
+        size: expected size of the file in bytes e.g. from a prior os.stat call
+
+    Returns:
+        text from the file
+    """
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        data = os.read(fd, size)
+        # the file may have grown since it was stat-ed and os.read can return fewer bytes than requested so keep
+        # reading until the end of the file
+        while chunk := os.read(fd, READ_CHUNK_SIZE):
+            data += chunk
+    finally:
+        os.close(fd)
+    python_code = data.decode("utf-8")
+    # match the universal newline translation of reading in text mode
+    if "\r" in python_code:
+        python_code = python_code.replace("\r\n", "\n").replace("\r", "\n")
     return python_code
 
 
@@ -113,10 +186,13 @@ def get_annotated_attribute_name(attribute: ast.AnnAssign) -> str:
     Raises:
         AttributeError: if the target does not have id attribute
     """
-    return check_and_get_attribute(attribute.target, "id", raise_exception=True)
+    target = attribute.target
+    if isinstance(target, ast.Name):
+        return target.id
+    return check_and_get_attribute(target, "id", raise_exception=True)
 
 
-def get_annotated_attribute_name_cst(attribute: libcst.AnnAssign) -> str:
+def get_annotated_attribute_name_cst(attribute: libcst.SimpleStatementLine) -> str:
     """
     Extract name from ast parsed annotated attribute
 
@@ -138,7 +214,10 @@ def get_annotated_attribute_name_cst(attribute: libcst.AnnAssign) -> str:
     """
     if not isinstance(attribute, libcst.SimpleStatementLine) or not isinstance(attribute.body[0], libcst.AnnAssign):
         raise TypeError("Attribute is not annotated attribute!")
-    return check_and_get_attribute(attribute.body[0].target, "value", raise_exception=True)
+    target = attribute.body[0].target
+    if isinstance(target, libcst.Name):
+        return target.value
+    return check_and_get_attribute(target, "value", raise_exception=True)
 
 
 def get_attribute_name(attribute: ast.Assign) -> str:
@@ -161,12 +240,15 @@ def get_attribute_name(attribute: ast.Assign) -> str:
         ValueError: if the targets attribute is empty
         AttributeError: if the target does not have id attribute
     """
-    if len(attribute.targets) == 0:
+    if not attribute.targets:
         raise ValueError("No targets found for the attribute")
-    return check_and_get_attribute(attribute.targets[0], "id", raise_exception=True)
+    target = attribute.targets[0]
+    if isinstance(target, ast.Name):
+        return target.id
+    return check_and_get_attribute(target, "id", raise_exception=True)
 
 
-def get_attribute_name_cst(attribute: libcst.Assign) -> str:
+def get_attribute_name_cst(attribute: libcst.SimpleStatementLine) -> str:
     """
     Extract name from ast parsed attribute
 
@@ -188,8 +270,10 @@ def get_attribute_name_cst(attribute: libcst.Assign) -> str:
     """
     if not isinstance(attribute, libcst.SimpleStatementLine) or not isinstance(attribute.body[0], libcst.Assign):
         raise TypeError("Attribute is not attribute!")
-    target = check_and_get_attribute(attribute.body[0].targets[0], "target", raise_exception=True)
-    return target.value
+    target = attribute.body[0].targets[0].target
+    if isinstance(target, libcst.Name):
+        return target.value
+    return check_and_get_attribute(target, "value", raise_exception=True)
 
 
 def get_ellipsis_name(expression: Union[ast.Expr, libcst.CSTNode]) -> str:
@@ -202,11 +286,12 @@ def get_ellipsis_name(expression: Union[ast.Expr, libcst.CSTNode]) -> str:
         name
     """
     if isinstance(expression, libcst.CSTNode):
-        return "ellipsis"
-    return str(check_and_get_attribute(expression.value, "value", raise_exception=True))
+        return ELLIPSIS_NAME
+    value = check_and_get_attribute(expression.value, "value", raise_exception=True)
+    return "Ellipsis" if value is Ellipsis else str(value)
 
 
-names_factory: Dict[type, Callable] = {
+names_factory: Final[Dict[type, Callable]] = {
     ast.FunctionDef: get_function_name_ast,
     ast.AnnAssign: get_annotated_attribute_name,
     ast.Assign: get_attribute_name,
@@ -214,7 +299,7 @@ names_factory: Dict[type, Callable] = {
 }
 
 
-cst_names_factory: Dict[type, Callable] = {
+cst_names_factory: Final[Dict[type, Callable]] = {
     libcst.FunctionDef: get_function_name_cst,
     libcst.AnnAssign: get_annotated_attribute_name_cst,
     libcst.Assign: get_attribute_name_cst,
@@ -247,10 +332,17 @@ def get_expression_name_ast(expression: ast.stmt) -> str:
     Returns:
         name of the expression
     """
-    if is_ellipsis(expression) and isinstance(expression, ast.Expr):
-        return get_ellipsis_name(expression)
-    if is_class_docstring(expression) and isinstance(expression, ast.Expr):
-        return DOCSTRING_NAME
+    if isinstance(expression, (ast.FunctionDef, ast.ClassDef)):
+        return expression.name
+    if isinstance(expression, ast.Expr):
+        if is_ellipsis(expression):
+            return get_ellipsis_name(expression)
+        if is_class_docstring(expression):
+            return DOCSTRING_NAME
+    elif isinstance(expression, ast.AnnAssign):
+        return get_annotated_attribute_name(expression)
+    elif isinstance(expression, ast.Assign):
+        return get_attribute_name(expression)
     return names_factory[type(expression)](expression)
 
 
@@ -264,16 +356,21 @@ def get_expression_name_cst(expression: libcst.CSTNode) -> str:
     Returns:
         name of the expression
     """
-    if is_ellipsis_cst(expression) and isinstance(expression, libcst.SimpleStatementLine):
-        return get_ellipsis_name(expression)
-    if is_class_docstring_cst(expression) and isinstance(expression, libcst.SimpleStatementLine):
-        return DOCSTRING_NAME
-
-    expr_type: type
+    if isinstance(expression, (libcst.FunctionDef, libcst.ClassDef)):
+        return expression.name.value
+    expr_type: type = type(expression)
     if isinstance(expression, libcst.SimpleStatementLine):
-        expr_type = type(expression.body[0])
-    else:
-        expr_type = type(expression)
+        statement = expression.body[0]
+        if isinstance(statement, libcst.AnnAssign):
+            return get_annotated_attribute_name_cst(expression)
+        if isinstance(statement, libcst.Assign):
+            return get_attribute_name_cst(expression)
+        if isinstance(statement, libcst.Expr):
+            if is_ellipsis_cst(expression):
+                return get_ellipsis_name(expression)
+            if is_class_docstring_cst(expression):
+                return DOCSTRING_NAME
+        expr_type = type(statement)
     return cst_names_factory[expr_type](expression)
 
 
@@ -318,35 +415,27 @@ def is_ellipsis_cst(expression: libcst.CSTNode) -> bool:
     """
     if not isinstance(expression, libcst.SimpleStatementLine):
         return False
-    if not isinstance(expression.body[0], libcst.Expr):
-        return False
-    return isinstance(expression.body[0].value, libcst.Ellipsis)
+    statement = expression.body[0]
+    return isinstance(statement, libcst.Expr) and isinstance(statement.value, libcst.Ellipsis)
 
 
 def is_class_docstring(expression: ast.AST) -> bool:
     """
     Determine if an expression is a class docstring
 
-    A class docstring is defined by triple double or single quotes.
+    A class docstring is an expression statement consisting of a single string literal.
 
     Args:
         expression: ast parsed expression
 
     Returns:
         True if the expression is a docstring
-
-    Raises:
-        AttributeError: if astor.to_source fails and its not due to the node representing a Comment
-
     """
-    try:
-        s: str = astor.to_source(expression)
-    except AttributeError as e:
-        if str(e) == "No defined handler for node of type Comment":
-            logging.debug("Comments are not supported by astor")
-            return False
-        raise
-    return (s.startswith('"""') and s.endswith('"""\n')) or (s.startswith("'''") and s.endswith("'''\n"))
+    return (
+        isinstance(expression, ast.Expr)
+        and isinstance(expression.value, ast.Constant)
+        and isinstance(expression.value.value, str)
+    )
 
 
 def is_class_docstring_cst(expression: libcst.CSTNode) -> bool:
@@ -364,11 +453,10 @@ def is_class_docstring_cst(expression: libcst.CSTNode) -> bool:
     """
     if not isinstance(expression, libcst.SimpleStatementLine):
         return False
-    if not isinstance(expression.body[0], libcst.Expr) or not hasattr(expression.body[0], "value"):
-        return False
-    s: str = check_and_get_attribute(expression.body[0].value, "value")
-    if s is None:
+    statement = expression.body[0]
+    if not isinstance(statement, libcst.Expr) or not isinstance(statement.value, libcst.SimpleString):
         return False
+    s = statement.value.value
     return (s.startswith('"""') and s.endswith('"""')) or (s.startswith("'''") and s.endswith("'''"))
 
 
@@ -387,42 +475,75 @@ def merge_code_strings(uncommented_code: str, commented_code: str) -> str:
     uncommented_lines = uncommented_code.split("\n")
     commented_lines = commented_code.split("\n")
 
-    comment_counter = 0  # keep track of number of comments
-    for line_uncommented, (j, _) in zip(uncommented_lines, enumerate(commented_lines)):
-        if j + comment_counter == len(commented_lines):
+    # walk both lists with a cursor each and build the merged lines in a new list
+    merged_lines: List[str] = []
+    n_commented = len(commented_lines)
+    c = 0
+    for line_uncommented in uncommented_lines:
+        # copy over an arbitrary number of comments
+        while c < n_commented and commented_lines[c].lstrip().startswith("#"):
+            merged_lines.append(commented_lines[c])
+            c += 1
+        if c == n_commented:
             break  # reached the end of the commented code
 
-        # iterate over an arbitrary number of comments and keep a count of them
-        while commented_lines[j + comment_counter].strip().startswith("#"):
-            comment_counter += 1
-
         # if come across a line break in the uncommented code
         # check that the equivalent position in commented code is a line break
-        # if not, then insert a line break
-        if line_uncommented == "":
-            if commented_lines[j + comment_counter] != "":
-                commented_lines.insert(j + comment_counter, "")
+        # if not, then add a line break
+        if line_uncommented == "" and commented_lines[c] != "":
+            merged_lines.append("")
+        else:
+            merged_lines.append(commented_lines[c])
+            c += 1
+    merged_lines.extend(commented_lines[c:])
 
     # Join the lines and return the merged code
-    return "\n".join(commented_lines)
+    return "\n".join(merged_lines)
+
 
+# fields of ast nodes which hold lists of statements (or of except handlers / match cases containing statements)
+_statement_list_fields: Final[Tuple[str, ...]] = ("body", "orelse", "finalbody", "handlers", "cases")
 
-def remove_comment_nodes(node: Any) -> Any:
+
+def remove_comment_nodes(node: Any, removed: Optional[List[Tuple[List[Any], List[Any]]]] = None) -> Any:
     """
     Remove instances of ast_comments.Comment from the AST tree
     Args:
         node: current node in the tree
+        removed: if provided, then each body list which had comments removed is appended along with a copy of its
+                original contents so that the comments can be restored
 
     Returns:
         node without comments
     """
-
-    if hasattr(node, "body"):
-        node.body = [remove_comment_nodes(n) for n in node.body if not isinstance(n, ast_comments.Comment)]
+    # ast_comments is only needed by the ast parser so defer the import until comments are stripped
+    import ast_comments  # pylint: disable=import-outside-toplevel
+
+    # walk the tree with an explicit stack and compact each statement list in place
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        for field in _statement_list_fields:
+            body = getattr(current, field, None)
+            if not isinstance(body, list):
+                continue
+            original = body.copy() if removed is not None else body
+            n_kept = 0
+            for child in body:
+                if isinstance(child, ast_comments.Comment):
+                    continue
+                body[n_kept] = child
+                n_kept += 1
+                stack.append(child)
+            if removed is not None and n_kept < len(body):
+                removed.append((body, original))
+            del body[n_kept:]
     return node
 
 
 def create_path(path: str) -> None:
-    if Path(path).suffix:
-        path = Path(path).parent.as_posix()
-    os.makedirs(path, exist_ok=True)
+    file_path = Path(path)
+    if file_path.suffix:
+        path = file_path.parent.as_posix()
+    if not os.path.isdir(path):
+        os.makedirs(path, exist_ok=True)
@@ -1,13 +1,13 @@
+import ast
+import functools
 import importlib
 import json
 import logging
 import os
-import subprocess
 from pathlib import Path
+from types import SimpleNamespace
 
 import ast_comments
-import astor
-import libcst
 import pytest
 from msort.config_loader import ConfigLoaderIni
 from msort.configs import DEFAULT_MSORT_PARAMS_SECTION
@@ -16,33 +16,22 @@ from msort.method_describers import get_method_describer
 from msort.utilities import extract_text_from_file
 
 DEBUG = "tests" in os.getcwd()
+SCRIPTS_DIR = "../scripts" if DEBUG else "./tests/scripts"
 
 
 @pytest.fixture
-def input_path(request):
-    if DEBUG:
-        return f"../scripts/{request.param}_input.py"
-    else:
-        return f"./tests/scripts/{request.param}_input.py"
-
-
-@pytest.fixture
-def output_path(request):
-    if DEBUG:
-        return f"../scripts/{request.param}_output.py"
-    else:
-        return f"./tests/scripts/{request.param}_output.py"
-
-
-@pytest.fixture
-def expected_path(request):
-    if DEBUG:
-        return f"../scripts/{request.param}_expected.py"
-    else:
-        return f"./tests/scripts/{request.param}_expected.py"
+def paths(request, tmp_path):
+    # request.param is the script name or a tuple of the input script name and the expected script name
+    name, expected_name = request.param if isinstance(request.param, tuple) else (request.param, request.param)
+    return SimpleNamespace(
+        input=f"{SCRIPTS_DIR}/{name}_input.py",
+        # write outputs to a per test directory so that tests do not share files and pytest handles the clean up
+        output=(tmp_path / f"{name}_output.py").as_posix(),
+        expected=f"{SCRIPTS_DIR}/{expected_name}_expected.py",
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def parser(request):
     return importlib.import_module(f"msort.{request.param}_functions")
 
@@ -53,455 +42,154 @@ def method_describer(request):
     return get_method_describer(parser_type=request.param, config=cfg)
 
 
+def formatting_case(parser_type: str, script):
+    # parametrize the parser, method describer and paths fixtures together so that each test gets a single id
+    name = script if isinstance(script, str) else script[-1]
+    return pytest.mark.parametrize(
+        ("parser", "method_describer", "paths"),
+        [pytest.param(parser_type, parser_type, script, id=f"{name}-{parser_type}")],
+        indirect=True,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _normalised_expected_code(expected_path: str, mtime_ns: int, comments: bool) -> str:
+    if comments:
+        return ast_comments.dump(ast_comments.parse(extract_text_from_file(expected_path)))
+    return ast.dump(ast.parse(extract_text_from_file(expected_path)))
+
+
+def normalised_expected_code(expected_path: str, comments: bool = False) -> str:
+    # expected scripts are shared by the ast and cst tests so only parse and dump each of them once - the mtime is
+    # part of the key so that editing an expected script during a session is picked up
+    return _normalised_expected_code(expected_path, os.stat(expected_path).st_mtime_ns, comments)
+
+
 def simple_test(
     parser,
     method_describer,
-    input_path,
-    output_path,
-    expected_path,
+    paths,
     comments: bool = False,
     use_cst: bool = False,
     **kwargs,
 ):
     format_msort(
-        parser=parser, file_path=input_path, output_py=output_path, method_describer=method_describer, **kwargs
+        parser=parser, file_path=paths.input, output_py=paths.output, method_describer=method_describer, **kwargs
     )
     if use_cst:
-        code = libcst.parse_module(extract_text_from_file(output_path))
-        expected_code = libcst.parse_module(extract_text_from_file(expected_path))
-        assert code.code_for_node(code) == expected_code.code_for_node(expected_code)
+        # libcst reproduces source code exactly so the text can be compared directly
+        assert extract_text_from_file(paths.output) == extract_text_from_file(paths.expected)
     elif comments:
-        code = ast_comments.parse(extract_text_from_file(output_path))
-        expected_code = ast_comments.parse(extract_text_from_file(expected_path))
-        assert ast_comments.unparse(code) == ast_comments.unparse(expected_code)
+        code = ast_comments.parse(extract_text_from_file(paths.output))
+        assert ast_comments.dump(code) == normalised_expected_code(paths.expected, comments=True)
     else:
-        code = astor.parse_file(output_path)
-        expected_code = astor.parse_file(expected_path)
-        assert astor.to_source(code) == astor.to_source(expected_code)
-    Path(output_path).unlink()
-
-
-@pytest.mark.parametrize("parser", ["ast"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["ast"], indirect=True)
-@pytest.mark.parametrize("input_path", ["basic"], indirect=True)
-@pytest.mark.parametrize("output_path", ["basic"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["basic"], indirect=True)
-def test_formatting_ast(parser, method_describer, input_path, output_path, expected_path):
-    simple_test(parser, method_describer, input_path, output_path, expected_path)
-
-
-@pytest.mark.parametrize("parser", ["cst"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["cst"], indirect=True)
-@pytest.mark.parametrize("input_path", ["basic"], indirect=True)
-@pytest.mark.parametrize("output_path", ["basic"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["basic"], indirect=True)
-def test_formatting_cst(parser, method_describer, input_path, output_path, expected_path):
-    simple_test(parser, method_describer, input_path, output_path, expected_path)
-
-
-@pytest.mark.parametrize("parser", ["ast"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["ast"], indirect=True)
-@pytest.mark.parametrize("input_path", ["empty"], indirect=True)
-@pytest.mark.parametrize("output_path", ["empty"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["empty"], indirect=True)
-def test_formatting_empty_ast(parser, method_describer, input_path, output_path, expected_path):
-    simple_test(parser, method_describer, input_path, output_path, expected_path)
-
-
-@pytest.mark.parametrize("parser", ["cst"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["cst"], indirect=True)
-@pytest.mark.parametrize("input_path", ["empty"], indirect=True)
-@pytest.mark.parametrize("output_path", ["empty"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["empty"], indirect=True)
-def test_formatting_empty_cst(parser, method_describer, input_path, output_path, expected_path):
-    simple_test(parser, method_describer, input_path, output_path, expected_path)
-
-
-@pytest.mark.parametrize("parser", ["ast"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["ast"], indirect=True)
-@pytest.mark.parametrize("input_path", ["attributes"], indirect=True)
-@pytest.mark.parametrize("output_path", ["attributes"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["attributes"], indirect=True)
-def test_formatting_attributes_ast(parser, method_describer, input_path, output_path, expected_path):
-    simple_test(parser, method_describer, input_path, output_path, expected_path)
-
-
-@pytest.mark.parametrize("parser", ["cst"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["cst"], indirect=True)
-@pytest.mark.parametrize("input_path", ["attributes"], indirect=True)
-@pytest.mark.parametrize("output_path", ["attributes"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["attributes"], indirect=True)
-def test_formatting_attributes_cst(parser, method_describer, input_path, output_path, expected_path):
-    simple_test(parser, method_describer, input_path, output_path, expected_path)
-
-
-@pytest.mark.parametrize("parser", ["ast"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["ast"], indirect=True)
-@pytest.mark.parametrize("input_path", ["decorators"], indirect=True)
-@pytest.mark.parametrize("output_path", ["decorators"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["decorators"], indirect=True)
-def test_formatting_decorators_ast(parser, method_describer, input_path, output_path, expected_path):
-    simple_test(parser, method_describer, input_path, output_path, expected_path)
-
-
-@pytest.mark.parametrize("parser", ["cst"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["cst"], indirect=True)
-@pytest.mark.parametrize("input_path", ["decorators"], indirect=True)
-@pytest.mark.parametrize("output_path", ["decorators"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["decorators"], indirect=True)
-def test_formatting_decorators_cst(parser, method_describer, input_path, output_path, expected_path):
-    simple_test(parser, method_describer, input_path, output_path, expected_path)
-
-
-@pytest.mark.parametrize("parser", ["ast"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["ast"], indirect=True)
-@pytest.mark.parametrize("input_path", ["multi_decorators"], indirect=True)
-@pytest.mark.parametrize("output_path", ["multi_decorators"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["multi_decorators"], indirect=True)
-def test_formatting_mutli_decorators_ast(parser, method_describer, input_path, output_path, expected_path):
-    simple_test(parser, method_describer, input_path, output_path, expected_path)
-
-
-@pytest.mark.parametrize("parser", ["cst"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["cst"], indirect=True)
-@pytest.mark.parametrize("input_path", ["multi_decorators"], indirect=True)
-@pytest.mark.parametrize("output_path", ["multi_decorators"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["multi_decorators"], indirect=True)
-def test_formatting_mutli_decorators_cst(parser, method_describer, input_path, output_path, expected_path):
-    simple_test(parser, method_describer, input_path, output_path, expected_path)
-
-
-@pytest.mark.parametrize("parser", ["ast"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["ast"], indirect=True)
-@pytest.mark.parametrize("input_path", ["other_code"], indirect=True)
-@pytest.mark.parametrize("output_path", ["other_code"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["other_code"], indirect=True)
-def test_formatting_other_code_ast(parser, method_describer, input_path, output_path, expected_path):
-    simple_test(parser, method_describer, input_path, output_path, expected_path)
-
-
-@pytest.mark.parametrize("parser", ["cst"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["cst"], indirect=True)
-@pytest.mark.parametrize("input_path", ["other_code"], indirect=True)
-@pytest.mark.parametrize("output_path", ["other_code"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["other_code"], indirect=True)
-def test_formatting_other_code_cst(parser, method_describer, input_path, output_path, expected_path):
-    simple_test(parser, method_describer, input_path, output_path, expected_path)
-
-
-@pytest.mark.parametrize("parser", ["ast"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["ast"], indirect=True)
-@pytest.mark.parametrize("input_path", ["docstrings_comments"], indirect=True)
-@pytest.mark.parametrize("output_path", ["docstrings_comments"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["docstrings_comments"], indirect=True)
-def test_formatting_docs_comments_ast(parser, method_describer, input_path, output_path, expected_path):
-    simple_test(parser, method_describer, input_path, output_path, expected_path, comments=True)
-
-
-@pytest.mark.parametrize("parser", ["cst"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["cst"], indirect=True)
-@pytest.mark.parametrize("input_path", ["docstrings_comments"], indirect=True)
-@pytest.mark.parametrize("output_path", ["docstrings_comments"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["docstrings_comments"], indirect=True)
-def test_formatting_docs_comments_cst(parser, method_describer, input_path, output_path, expected_path):
-    simple_test(parser, method_describer, input_path, output_path, expected_path, comments=True)
-
-
-@pytest.mark.parametrize("parser", ["ast"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["ast"], indirect=True)
-@pytest.mark.parametrize("input_path", ["msort_group"], indirect=True)
-@pytest.mark.parametrize("output_path", ["msort_group"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["msort_group"], indirect=True)
-def test_formatting_msort_group_ast(parser, method_describer, input_path, output_path, expected_path):
-    simple_test(parser, method_describer, input_path, output_path, expected_path)
-
-
-@pytest.mark.parametrize("parser", ["cst"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["cst"], indirect=True)
-@pytest.mark.parametrize("input_path", ["msort_group"], indirect=True)
-@pytest.mark.parametrize("output_path", ["msort_group"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["msort_group"], indirect=True)
-def test_formatting_msort_group_cst(parser, method_describer, input_path, output_path, expected_path):
-    simple_test(parser, method_describer, input_path, output_path, expected_path)
-
-
-@pytest.mark.parametrize("parser", ["cst"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["cst"], indirect=True)
-@pytest.mark.parametrize("input_path", ["msort_group"], indirect=True)
-@pytest.mark.parametrize("output_path", ["msort_group"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["msort_group_blocked"], indirect=True)
-def test_formatting_msort_group_cst_blocked(parser, method_describer, input_path, output_path, expected_path):
+        code = ast.parse(extract_text_from_file(paths.output))
+        assert ast.dump(code) == normalised_expected_code(paths.expected)
+
+
+# (parser type, script name, keyword arguments for simple_test) for each of the straightforward formatting tests
+FORMATTING_CASES = [
+    ("ast", "basic", {}),
+    ("cst", "basic", {}),
+    ("ast", "empty", {}),
+    ("cst", "empty", {}),
+    ("ast", "attributes", {}),
+    ("cst", "attributes", {}),
+    ("ast", "decorators", {}),
+    ("cst", "decorators", {}),
+    ("ast", "multi_decorators", {}),
+    ("cst", "multi_decorators", {}),
+    ("ast", "other_code", {}),
+    ("cst", "other_code", {}),
+    ("ast", "docstrings_comments", {"comments": True}),
+    ("cst", "docstrings_comments", {"comments": True}),
+    ("ast", "msort_group", {}),
+    ("cst", "msort_group", {}),
+    ("ast", "imports", {}),
+    ("cst", "imports", {}),
+    ("cst", "pandas", {"use_cst": True}),
+    ("ast", "msort_multi_group", {}),
+    ("cst", "msort_multi_group", {"use_cst": True}),
+    ("ast", "nested_classes", {}),
+    ("cst", "nested_classes", {"use_cst": True}),
+    ("ast", "nested_classes_static", {"auto_static": True}),
+    ("cst", "nested_classes_static", {"use_cst": True, "auto_static": True}),
+    ("ast", "nested_function_classes", {}),
+    ("cst", "nested_function_classes", {"use_cst": True}),
+    ("ast", "nested_function_classes_static", {"auto_static": True}),
+    ("cst", "nested_function_classes_static", {"use_cst": True, "auto_static": True}),
+    ("ast", "class_decorator", {}),
+    ("cst", "class_decorator", {"use_cst": True}),
+    ("ast", "property_grouping", {"use_property_groups": True}),
+    ("cst", "property_grouping", {"use_cst": True, "use_property_groups": True}),
+]
+
+
+@pytest.mark.parametrize(
+    ("parser", "method_describer", "paths", "options"),
+    [pytest.param(p, p, name, options, id=f"{name}-{p}") for p, name, options in FORMATTING_CASES],
+    indirect=["parser", "method_describer", "paths"],
+)
+def test_formatting(parser, method_describer, paths, options):
+    simple_test(parser, method_describer, paths, **options)
+
+
+@formatting_case("cst", ("msort_group", "msort_group_blocked"))
+def test_formatting_msort_group_cst_blocked(parser, method_describer, paths):
     method_describer._config[DEFAULT_MSORT_PARAMS_SECTION]["use_msort_group"] = str(False)
-    simple_test(parser, method_describer, input_path, output_path, expected_path)
-
+    simple_test(parser, method_describer, paths)
 
-@pytest.mark.parametrize("parser", ["ast"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["ast"], indirect=True)
-@pytest.mark.parametrize("input_path", ["imports"], indirect=True)
-@pytest.mark.parametrize("output_path", ["imports"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["imports"], indirect=True)
-def test_formatting_imports_ast(parser, method_describer, input_path, output_path, expected_path):
-    simple_test(parser, method_describer, input_path, output_path, expected_path)
 
+def run_script(script_path: str) -> None:
+    # the scripts are trusted test fixtures so run them in process rather than starting a new interpreter
+    exec(compile(extract_text_from_file(script_path), script_path, "exec"), {"__name__": "__main__"})
 
-@pytest.mark.parametrize("parser", ["cst"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["cst"], indirect=True)
-@pytest.mark.parametrize("input_path", ["imports"], indirect=True)
-@pytest.mark.parametrize("output_path", ["imports"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["imports"], indirect=True)
-def test_formatting_imports_cst(parser, method_describer, input_path, output_path, expected_path):
-    simple_test(parser, method_describer, input_path, output_path, expected_path)
 
+def complex_test(parser, method_describer, paths, monkeypatch):
+    format_msort(parser=parser, file_path=paths.input, output_py=paths.output, method_describer=method_describer)
+    code = ast_comments.parse(extract_text_from_file(paths.output))
+    assert ast_comments.dump(code) == normalised_expected_code(paths.expected, comments=True)
 
-def complex_test(parser, method_describer, input_path, output_path, expected_path):
-    format_msort(parser=parser, file_path=input_path, output_py=output_path, method_describer=method_describer)
-    code = ast_comments.parse(extract_text_from_file(output_path))
-    expected_code = ast_comments.parse(extract_text_from_file(expected_path))
-    assert ast_comments.unparse(code) == ast_comments.unparse(expected_code)
-
-    process = subprocess.Popen(["python", input_path], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    output, error = process.communicate()
-    assert not error
+    # the scripts write primes.json to the working directory so run them from the test's temporary directory
+    input_path = os.path.abspath(paths.input)
+    monkeypatch.chdir(Path(paths.output).parent)
+    run_script(input_path)
     with open("primes.json", "r") as f:
         input_data = json.load(f)
 
-    process = subprocess.Popen(["python", output_path], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    output, error = process.communicate()
-    assert not error
+    run_script(paths.output)
     with open("primes.json", "r") as f:
         output_data = json.load(f)
 
     assert input_data["primes"] == output_data["primes"]
 
-    Path(output_path).unlink()
-    Path("primes.json").unlink()
-
 
-@pytest.mark.parametrize("parser", ["ast"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["ast"], indirect=True)
-@pytest.mark.parametrize("input_path", ["complex"], indirect=True)
-@pytest.mark.parametrize("output_path", ["complex"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["complex"], indirect=True)
-def test_formatting_complex_ast(parser, method_describer, input_path, output_path, expected_path):
-    complex_test(parser, method_describer, input_path, output_path, expected_path)
+@formatting_case("ast", "complex")
+def test_formatting_complex_ast(parser, method_describer, paths, monkeypatch):
+    complex_test(parser, method_describer, paths, monkeypatch)
 
 
-@pytest.mark.parametrize("parser", ["cst"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["cst"], indirect=True)
-@pytest.mark.parametrize("input_path", ["complex"], indirect=True)
-@pytest.mark.parametrize("output_path", ["complex"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["complex"], indirect=True)
-def test_formatting_complex_cst(parser, method_describer, input_path, output_path, expected_path):
-    complex_test(parser, method_describer, input_path, output_path, expected_path)
+@formatting_case("cst", "complex")
+def test_formatting_complex_cst(parser, method_describer, paths, monkeypatch):
+    complex_test(parser, method_describer, paths, monkeypatch)
 
 
-@pytest.mark.parametrize("parser", ["ast"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["ast"], indirect=True)
-@pytest.mark.parametrize("input_path", ["pandas"], indirect=True)
-@pytest.mark.parametrize("output_path", ["pandas"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["pandas"], indirect=True)
-def test_formatting_pandas_ast(parser, method_describer, input_path, output_path, expected_path):
+@formatting_case("ast", "pandas")
+def test_formatting_pandas_ast(parser, method_describer, paths):
     # expect this to fail due to quote change by AST
     with pytest.raises(AssertionError):
-        simple_test(parser, method_describer, input_path, output_path, expected_path, use_cst=True)
-
+        simple_test(parser, method_describer, paths, use_cst=True)
 
-@pytest.mark.parametrize("parser", ["cst"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["cst"], indirect=True)
-@pytest.mark.parametrize("input_path", ["pandas"], indirect=True)
-@pytest.mark.parametrize("output_path", ["pandas"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["pandas"], indirect=True)
-def test_formatting_pandas_cst(parser, method_describer, input_path, output_path, expected_path):
-    simple_test(parser, method_describer, input_path, output_path, expected_path, use_cst=True)
 
-
-@pytest.mark.parametrize("parser", ["ast"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["ast"], indirect=True)
-@pytest.mark.parametrize("input_path", ["auto_static"], indirect=True)
-@pytest.mark.parametrize("output_path", ["auto_static"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["auto_static"], indirect=True)
-def test_formatting_auto_static_ast(parser, method_describer, input_path, output_path, expected_path, caplog):
+@formatting_case("ast", "auto_static")
+def test_formatting_auto_static_ast(parser, method_describer, paths, caplog):
     caplog.set_level(logging.INFO)
-    simple_test(parser, method_describer, input_path, output_path, expected_path, auto_static=True)
+    simple_test(parser, method_describer, paths, auto_static=True)
     assert "msort converted 1 methods from MyClass to static!" in caplog.messages
 
 
-@pytest.mark.parametrize("parser", ["cst"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["cst"], indirect=True)
-@pytest.mark.parametrize("input_path", ["auto_static"], indirect=True)
-@pytest.mark.parametrize("output_path", ["auto_static"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["auto_static"], indirect=True)
-def test_formatting_auto_static_cst(parser, method_describer, input_path, output_path, expected_path, caplog):
+@formatting_case("cst", "auto_static")
+def test_formatting_auto_static_cst(parser, method_describer, paths, caplog):
     caplog.set_level(logging.INFO)
-    simple_test(parser, method_describer, input_path, output_path, expected_path, use_cst=True, auto_static=True)
+    simple_test(parser, method_describer, paths, use_cst=True, auto_static=True)
     assert "msort converted 1 methods from MyClass to static!" in caplog.messages
-
-
-@pytest.mark.parametrize("parser", ["ast"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["ast"], indirect=True)
-@pytest.mark.parametrize("input_path", ["msort_multi_group"], indirect=True)
-@pytest.mark.parametrize("output_path", ["msort_multi_group"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["msort_multi_group"], indirect=True)
-def test_formatting_msort_multi_group_ast(parser, method_describer, input_path, output_path, expected_path, caplog):
-    caplog.set_level(logging.INFO)
-    simple_test(parser, method_describer, input_path, output_path, expected_path, use_cst=False, auto_static=False)
-
-
-@pytest.mark.parametrize("parser", ["cst"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["cst"], indirect=True)
-@pytest.mark.parametrize("input_path", ["msort_multi_group"], indirect=True)
-@pytest.mark.parametrize("output_path", ["msort_multi_group"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["msort_multi_group"], indirect=True)
-def test_formatting_msort_multi_group_cst(parser, method_describer, input_path, output_path, expected_path, caplog):
-    caplog.set_level(logging.INFO)
-    simple_test(parser, method_describer, input_path, output_path, expected_path, use_cst=True, auto_static=False)
-
-
-@pytest.mark.parametrize("parser", ["ast"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["ast"], indirect=True)
-@pytest.mark.parametrize("input_path", ["nested_classes"], indirect=True)
-@pytest.mark.parametrize("output_path", ["nested_classes"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["nested_classes"], indirect=True)
-def test_formatting_msort_nested_classes_ast(parser, method_describer, input_path, output_path, expected_path, caplog):
-    caplog.set_level(logging.INFO)
-    simple_test(parser, method_describer, input_path, output_path, expected_path, use_cst=False, auto_static=False)
-
-
-@pytest.mark.parametrize("parser", ["cst"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["cst"], indirect=True)
-@pytest.mark.parametrize("input_path", ["nested_classes"], indirect=True)
-@pytest.mark.parametrize("output_path", ["nested_classes"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["nested_classes"], indirect=True)
-def test_formatting_msort_nested_classes_cst(parser, method_describer, input_path, output_path, expected_path, caplog):
-    caplog.set_level(logging.INFO)
-    simple_test(parser, method_describer, input_path, output_path, expected_path, use_cst=True, auto_static=False)
-
-
-@pytest.mark.parametrize("parser", ["cst"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["cst"], indirect=True)
-@pytest.mark.parametrize("input_path", ["nested_classes_static"], indirect=True)
-@pytest.mark.parametrize("output_path", ["nested_classes_static"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["nested_classes_static"], indirect=True)
-def test_formatting_msort_nested_classes_auto_static_cst(
-    parser, method_describer, input_path, output_path, expected_path, caplog
-):
-    caplog.set_level(logging.INFO)
-    simple_test(parser, method_describer, input_path, output_path, expected_path, use_cst=True, auto_static=True)
-
-
-@pytest.mark.parametrize("parser", ["ast"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["ast"], indirect=True)
-@pytest.mark.parametrize("input_path", ["nested_classes_static"], indirect=True)
-@pytest.mark.parametrize("output_path", ["nested_classes_static"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["nested_classes_static"], indirect=True)
-def test_formatting_msort_nested_classes_auto_static_ast(
-    parser, method_describer, input_path, output_path, expected_path, caplog
-):
-    caplog.set_level(logging.INFO)
-    simple_test(parser, method_describer, input_path, output_path, expected_path, use_cst=False, auto_static=True)
-
-
-@pytest.mark.parametrize("parser", ["ast"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["ast"], indirect=True)
-@pytest.mark.parametrize("input_path", ["nested_function_classes"], indirect=True)
-@pytest.mark.parametrize("output_path", ["nested_function_classes"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["nested_function_classes"], indirect=True)
-def test_formatting_msort_nested_function_classes_ast(
-    parser, method_describer, input_path, output_path, expected_path, caplog
-):
-    caplog.set_level(logging.INFO)
-    simple_test(parser, method_describer, input_path, output_path, expected_path, use_cst=False, auto_static=False)
-
-
-@pytest.mark.parametrize("parser", ["cst"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["cst"], indirect=True)
-@pytest.mark.parametrize("input_path", ["nested_function_classes"], indirect=True)
-@pytest.mark.parametrize("output_path", ["nested_function_classes"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["nested_function_classes"], indirect=True)
-def test_formatting_msort_nested_function_classes_cst(
-    parser, method_describer, input_path, output_path, expected_path, caplog
-):
-    caplog.set_level(logging.INFO)
-    simple_test(parser, method_describer, input_path, output_path, expected_path, use_cst=True, auto_static=False)
-
-
-@pytest.mark.parametrize("parser", ["cst"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["cst"], indirect=True)
-@pytest.mark.parametrize("input_path", ["nested_function_classes_static"], indirect=True)
-@pytest.mark.parametrize("output_path", ["nested_function_classes_static"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["nested_function_classes_static"], indirect=True)
-def test_formatting_msort_nested_function_classes_auto_static_cst(
-    parser, method_describer, input_path, output_path, expected_path, caplog
-):
-    caplog.set_level(logging.INFO)
-    simple_test(parser, method_describer, input_path, output_path, expected_path, use_cst=True, auto_static=True)
-
-
-@pytest.mark.parametrize("parser", ["ast"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["ast"], indirect=True)
-@pytest.mark.parametrize("input_path", ["nested_function_classes_static"], indirect=True)
-@pytest.mark.parametrize("output_path", ["nested_function_classes_static"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["nested_function_classes_static"], indirect=True)
-def test_formatting_msort_nested_function_classes_auto_static_ast(
-    parser, method_describer, input_path, output_path, expected_path, caplog
-):
-    caplog.set_level(logging.INFO)
-    simple_test(parser, method_describer, input_path, output_path, expected_path, use_cst=False, auto_static=True)
-
-
-@pytest.mark.parametrize("parser", ["cst"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["cst"], indirect=True)
-@pytest.mark.parametrize("input_path", ["class_decorator"], indirect=True)
-@pytest.mark.parametrize("output_path", ["class_decorator"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["class_decorator"], indirect=True)
-def test_formatting_msort_class_decorator_cst(parser, method_describer, input_path, output_path, expected_path, caplog):
-    caplog.set_level(logging.INFO)
-    simple_test(parser, method_describer, input_path, output_path, expected_path, use_cst=True, auto_static=False)
-
-
-@pytest.mark.parametrize("parser", ["ast"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["ast"], indirect=True)
-@pytest.mark.parametrize("input_path", ["class_decorator"], indirect=True)
-@pytest.mark.parametrize("output_path", ["class_decorator"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["class_decorator"], indirect=True)
-def test_formatting_msort_class_decorator_ast(parser, method_describer, input_path, output_path, expected_path, caplog):
-    caplog.set_level(logging.INFO)
-    simple_test(parser, method_describer, input_path, output_path, expected_path, use_cst=False, auto_static=False)
-
-
-@pytest.mark.parametrize("parser", ["cst"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["cst"], indirect=True)
-@pytest.mark.parametrize("input_path", ["property_grouping"], indirect=True)
-@pytest.mark.parametrize("output_path", ["property_grouping"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["property_grouping"], indirect=True)
-def test_formatting_msort_class_decorator_cst(parser, method_describer, input_path, output_path, expected_path, caplog):
-    caplog.set_level(logging.INFO)
-    simple_test(
-        parser,
-        method_describer,
-        input_path,
-        output_path,
-        expected_path,
-        use_cst=True,
-        auto_static=False,
-        use_property_groups=True,
-    )
-
-
-@pytest.mark.parametrize("parser", ["ast"], indirect=True)
-@pytest.mark.parametrize("method_describer", ["ast"], indirect=True)
-@pytest.mark.parametrize("input_path", ["property_grouping"], indirect=True)
-@pytest.mark.parametrize("output_path", ["property_grouping"], indirect=True)
-@pytest.mark.parametrize("expected_path", ["property_grouping"], indirect=True)
-def test_formatting_msort_class_decorator_ast(parser, method_describer, input_path, output_path, expected_path, caplog):
-    caplog.set_level(logging.INFO)
-    simple_test(
-        parser,
-        method_describer,
-        input_path,
-        output_path,
-        expected_path,
-        use_cst=False,
-        auto_static=False,
-        use_property_groups=True,
-    )
@@ -1,8 +1,10 @@
 import argparse
+import functools
 import logging
+import multiprocessing
 import os
-import shutil
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from unittest.mock import patch
 
@@ -23,10 +25,9 @@ def script_path():
 
 
 @pytest.fixture
-def output_path():
-    if DEBUG:
-        return "../scripts/output/basic_output.py"
-    return "tests/scripts/output/basic_output.py"
+def output_path(tmp_path):
+    # written outputs go to a per test directory which pytest cleans up, even when a test fails
+    return (tmp_path / "output" / "basic_output.py").as_posix()
 
 
 @pytest.fixture
@@ -106,10 +107,32 @@ def test_validate_paths_input_file_output_dir(script_path, output_path):
     assert isinstance(inputs, list)
     assert isinstance(outputs, list)
     assert len(inputs) == len(outputs)
-    assert (
-        outputs[0]
-        == Path(script_path).parent.joinpath(Path(output_path).stem).joinpath(Path(script_path).name).as_posix()
-    )
+    assert outputs[0] == Path(output_path).joinpath(Path(script_path).name).as_posix()
+
+
+def test_validate_paths_input_dir_symlinked_file(tmp_path):
+    (tmp_path / "real").mkdir()
+    (tmp_path / "real" / "a.py").write_text("x = 1\n")
+    (tmp_path / "link.py").symlink_to(tmp_path / "real" / "a.py")
+    inputs, _ = validate_paths(files=[], input_path=tmp_path.as_posix())
+    assert sorted(Path(i).relative_to(tmp_path).as_posix() for i in inputs) == ["link.py", "real/a.py"]
+
+
+def test_validate_paths_input_dir_unreadable_subdirectory(tmp_path, monkeypatch):
+    (tmp_path / "ok").mkdir()
+    (tmp_path / "ok" / "a.py").write_text("x = 1\n")
+    (tmp_path / "locked").mkdir()
+    (tmp_path / "locked" / "b.py").write_text("x = 1\n")
+    scandir = os.scandir
+
+    def locked_scandir(path):
+        if os.path.basename(path) == "locked":
+            raise PermissionError(path)
+        return scandir(path)
+
+    monkeypatch.setattr("msort.main.os.scandir", locked_scandir)
+    inputs, _ = validate_paths(files=[], input_path=tmp_path.as_posix())
+    assert [Path(i).relative_to(tmp_path).as_posix() for i in inputs] == ["ok/a.py"]
 
 
 def test_validate_paths_not_exist():
@@ -118,13 +141,11 @@ def test_validate_paths_not_exist():
         validate_paths(files=[], input_path=input_path)
 
 
-def test_main_no_scripts(caplog):
-    os.makedirs("empty_dir", exist_ok=True)
-    commands = ["", "--input-path=./empty_dir"]  # mock script name
+def test_main_no_scripts(tmp_path, caplog):
+    commands = ["", f"--input-path={tmp_path.as_posix()}"]  # mock script name
     with patch.object(sys, "argv", commands):
         main()
-    assert "No Python scripts found in ./empty_dir" in caplog.messages
-    shutil.rmtree("./empty_dir")
+    assert f"No Python scripts found in {tmp_path.as_posix()}" in caplog.messages
 
 
 def test_validate_paths_with_files(script_path, caplog):
@@ -141,7 +162,6 @@ def test_main(script_path, output_path, caplog):
         main()
     assert Path(output_path).exists()
     assert f"Reformatting {script_path} ..." in caplog.messages
-    shutil.rmtree(Path(output_path).parent.as_posix())
 
 
 def test_main_cst(script_path, output_path, caplog):
@@ -157,7 +177,6 @@ def test_main_cst(script_path, output_path, caplog):
     assert Path(output_path).exists()
     assert f"Reformatting {script_path} ..." in caplog.messages
     assert "Using the CST parser!" in caplog.messages
-    shutil.rmtree(Path(output_path).parent.as_posix())
 
 
 def test_main_ast(script_path, output_path, caplog):
@@ -173,7 +192,6 @@ def test_main_ast(script_path, output_path, caplog):
     assert Path(output_path).exists()
     assert f"Reformatting {script_path} ..." in caplog.messages
     assert "Using the AST parser!" in caplog.messages
-    shutil.rmtree(Path(output_path).parent.as_posix())
 
 
 def test_main_check_unchanged(script_path, caplog):
@@ -264,7 +282,6 @@ def test_main_ini_config(script_path, output_path, ini_config_path, caplog):
     assert Path(output_path).exists()
     assert f"Reformatting {script_path} ..." in caplog.messages
     assert f"Loading msort configurations from {ini_config_path}" in caplog.messages
-    shutil.rmtree(Path(output_path).parent.as_posix())
 
 
 def test_main_toml_config(script_path, output_path, toml_config_path, caplog):
@@ -280,4 +297,42 @@ def test_main_toml_config(script_path, output_path, toml_config_path, caplog):
     assert Path(output_path).exists()
     assert f"Reformatting {script_path} ..." in caplog.messages
     assert f"Loading msort configurations from {toml_config_path}" in caplog.messages
-    shutil.rmtree(Path(output_path).parent.as_posix())
+
+
+def test_main_multiprocessing(script_path, tmp_path, caplog, monkeypatch):
+    caplog.set_level(logging.INFO)
+    monkeypatch.setattr("msort.main._available_cpus", lambda: 2)
+    monkeypatch.setattr("msort.main._min_scripts_for_multiprocessing", lambda: 1)
+    input_dir = Path(script_path).parent.as_posix()
+    commands = ["", f"--input-path={input_dir}", f"--output-path={tmp_path.as_posix()}", "--parser=cst"]
+    with patch.object(sys, "argv", commands):
+        main()
+    n_scripts = len(list(Path(input_dir).glob("*.py")))
+    n_modified = len(list(tmp_path.glob("*.py")))
+    assert any(f"msort modified {n_modified} / {n_scripts} files!" in msg for msg in caplog.messages)
+    assert (tmp_path / "basic_input.py").exists()
+
+
+def test_main_multiprocessing_spawn_logging(script_path, tmp_path, capfd, monkeypatch):
+    # spawned workers do not inherit the logging set up of the main process so they must configure it themselves
+    spawn_executor = functools.partial(ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn"))
+    monkeypatch.setattr("msort.main.ProcessPoolExecutor", spawn_executor)
+    monkeypatch.setattr("msort.main._available_cpus", lambda: 2)
+    monkeypatch.setattr("msort.main._min_scripts_for_multiprocessing", lambda: 1)
+    input_dir = Path(script_path).parent.as_posix()
+    commands = ["", f"--input-path={input_dir}", f"--output-path={tmp_path.as_posix()}", "--auto-static", "-v", "1"]
+    with patch.object(sys, "argv", commands):
+        main()
+    assert "msort converted 1 methods from MyClass to static!" in capfd.readouterr().err
+
+
+@pytest.mark.parametrize("n_cpus, min_scripts", [(1, 1), (2, 1000)])
+def test_main_multiprocessing_serial_fallback(script_path, tmp_path, monkeypatch, n_cpus, min_scripts):
+    monkeypatch.setattr("msort.main._available_cpus", lambda: n_cpus)
+    monkeypatch.setattr("msort.main._min_scripts_for_multiprocessing", lambda: min_scripts)
+    input_dir = Path(script_path).parent.as_posix()
+    commands = ["", f"--input-path={input_dir}", f"--output-path={tmp_path.as_posix()}"]
+    with patch.object(sys, "argv", commands), patch("msort.main.ProcessPoolExecutor") as executor:
+        main()
+    executor.assert_not_called()
+    assert (tmp_path / "basic_input.py").exists()
@@ -12,32 +12,30 @@ from msort.configs import DEFAULT_MSORT_ORDER_PARAMS
 
 
 DEBUG = "tests" in os.getcwd()
+CONFIG_DIR = "." if DEBUG else "./tests/unit"
 
 
 @pytest.fixture
 def ini_config_path():
-    if DEBUG:
-        return "./msort.ini"
-    return "./tests/unit/msort.ini"
+    return f"{CONFIG_DIR}/msort.ini"
 
 
 @pytest.fixture
 def toml_config_path():
-    if DEBUG:
-        return "./pyproject_test.toml"
-    return "./tests/unit/pyproject_test.toml"
+    return f"{CONFIG_DIR}/pyproject_test.toml"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ini_reader():
     return IniReader()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def toml_reader():
     return TomlReader
 
 
+# _read_config marks the config loaders as loaded so each test needs a fresh instance
 @pytest.fixture
 def config_no_path():
     return ConfigLoaderIni()
@@ -154,7 +152,7 @@ def test_config_loader_load_config_none(config_no_path, caplog):
     with patch("msort.config_loader.ConfigLoader.get_config_file_path", return_value=None):
         cfg = config_no_path._load_config()
     assert "No config file found! Using default behaviours." in caplog.messages
-    assert {k: int(v) for k, v in cfg["msort.order"].items()} == DEFAULT_MSORT_ORDER_PARAMS
+    assert cfg["msort.order"] == DEFAULT_MSORT_ORDER_PARAMS
 
 
 def test_toml_reader_read(toml_config_path):
@@ -1,18 +1,21 @@
 import logging
-import os
+from pathlib import Path
+from typing import Callable
+from typing import Dict
+from typing import List
 from unittest.mock import Mock
 
 import libcst
 import msort.cst_functions as CST
 import pytest
-from msort.ast_functions import is_class_method
-from msort.ast_functions import is_getter
-from msort.ast_functions import is_property
-from msort.ast_functions import is_setter
-from msort.ast_functions import is_static_method
 from msort.decorators import _get_decorators_cst
 from msort.decorators import get_decorator_id_cst
 from msort.decorators import StaticMethodChecker
+from msort.generic_functions import is_class_method
+from msort.generic_functions import is_getter
+from msort.generic_functions import is_property
+from msort.generic_functions import is_setter
+from msort.generic_functions import is_static_method
 from msort.utilities import extract_text_from_file
 from msort.utilities import get_annotated_attribute_name_cst
 from msort.utilities import get_attribute_name_cst
@@ -20,27 +23,56 @@ from msort.utilities import get_function_name_cst
 from msort.utilities import is_class_docstring_cst
 from msort.utilities import is_ellipsis_cst
 
-if os.getcwd().endswith("unit"):
-    os.chdir("../..")
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
 
-DEBUG = "tests" in os.getcwd()
+METHOD_PREDICATES: Dict[str, Callable] = {
+    "dunder_method": CST.is_dunder_method,
+    "property": is_property,
+    "setter": is_setter,
+    "static_method": is_static_method,
+    "class_method": is_class_method,
+    "getter": is_getter,
+}
 
 
-@pytest.fixture
-def script_path(request):
-    # if DEBUG:
-    # return f"../scripts/{request.param}_input.py"
-    return f"./tests/scripts/{request.param}_input.py"
+def parse_script(name: str) -> libcst.Module:
+    # libcst trees are immutable so the module fixtures below parse each script once and share it between tests
+    return libcst.parse_module(extract_text_from_file((SCRIPTS_DIR / f"{name}_input.py").as_posix()))
 
 
-@pytest.fixture
-def mock_statement(script_path):
-    return extract_text_from_file(script_path)
+@pytest.fixture(scope="module")
+def basic_module():
+    return parse_script("basic")
 
 
-@pytest.fixture
-def mock_cst_module(mock_statement):
-    return libcst.parse_module(mock_statement)
+@pytest.fixture(scope="module")
+def attributes_module():
+    return parse_script("attributes")
+
+
+@pytest.fixture(scope="module")
+def auto_static_module():
+    return parse_script("auto_static")
+
+
+@pytest.fixture(scope="module")
+def docstrings_comments_module():
+    return parse_script("docstrings_comments")
+
+
+@pytest.fixture(scope="module")
+def empty_module():
+    return parse_script("empty")
+
+
+@pytest.fixture(scope="module")
+def multi_decorators_module():
+    return parse_script("multi_decorators")
+
+
+@pytest.fixture(scope="module")
+def basic_methods(basic_module):
+    return tuple(basic_module.body[0].body.body)
 
 
 @pytest.fixture
@@ -54,134 +86,96 @@ def test_update_node_wrong_type():
         CST.update_node(cls, [])
 
 
-@pytest.mark.parametrize("script_path", ["basic"], indirect=True)
-def test_cst_extract_classes(mock_cst_module):
-    output = CST.find_classes(mock_cst_module)
+def test_cst_extract_classes(basic_module):
+    output = CST.find_classes(basic_module)
     assert isinstance(output, dict)
     assert len(output) == 1
     assert "MyClass" in output
 
 
-@pytest.mark.parametrize("script_path", ["basic"], indirect=True)
-def test_cst_extract_class_components(mock_cst_module):
-    output = CST.extract_class_components(mock_cst_module.body[0])
+def test_cst_extract_class_components(basic_module):
+    output = CST.extract_class_components(basic_module.body[0])
     assert len(output) == 10
     assert output[0].name.value == "__init__"
 
 
-@pytest.mark.parametrize("script_path", ["basic"], indirect=True)
-def test_cst_is_dunder_method(mock_cst_module):
-    output = [CST.is_dunder_method(method) for method in mock_cst_module.body[0].body.body]
-    assert len(output) == 10
-    assert sum(output) == 2
-    assert output[0]
-    assert output[5]
+def classify_methods(methods) -> Dict[str, List[int]]:
+    # a single pass over the class body which records the indices of the methods matched by each predicate
+    categories: Dict[str, List[int]] = {name: [] for name in METHOD_PREDICATES}
+    for i, method in enumerate(methods):
+        for name, predicate in METHOD_PREDICATES.items():
+            if predicate(method):
+                categories[name].append(i)
+    return categories
+
+
+def test_cst_method_predicates(basic_methods):
+    assert len(basic_methods) == 10
+    assert classify_methods(basic_methods) == {
+        "dunder_method": [0, 5],
+        "property": [3],
+        "setter": [4],
+        "static_method": [6],
+        "class_method": [7],
+        "getter": [9],
+    }
 
 
 def test_cst_is_dunder_method_no_name():
     assert not CST.is_dunder_method(5)
 
 
-@pytest.mark.parametrize("script_path", ["multi_decorators"], indirect=True)
-def test_get_decorator_id_cst(mock_cst_module):
-    output = get_decorator_id_cst(mock_cst_module.body[3].body.body[7].decorators[0])
+def test_get_decorator_id_cst(multi_decorators_module):
+    output = get_decorator_id_cst(multi_decorators_module.body[3].body.body[7].decorators[0])
     assert output == "lru_cache"
 
 
-@pytest.mark.parametrize("script_path", ["multi_decorators"], indirect=True)
-def test_get_decorators_cst(mock_cst_module):
-    output = _get_decorators_cst(mock_cst_module.body[3].body.body[7])
+def test_get_decorators_cst(multi_decorators_module):
+    output = _get_decorators_cst(multi_decorators_module.body[3].body.body[7])
     assert output == ["lru_cache", "staticmethod"]
 
 
-@pytest.mark.parametrize("script_path", ["basic"], indirect=True)
-def test_is_class_method(mock_cst_module):
-    output = [is_class_method(method) for method in mock_cst_module.body[0].body.body]
-    assert len(output) == 10
-    assert sum(output) == 1
-    assert output[-3]
-
-
-@pytest.mark.parametrize("script_path", ["basic"], indirect=True)
-def test_is_static_method(mock_cst_module):
-    output = [is_static_method(method) for method in mock_cst_module.body[0].body.body]
-    assert len(output) == 10
-    assert sum(output) == 1
-    assert output[-4]
-
-
-@pytest.mark.parametrize("script_path", ["basic"], indirect=True)
-def test_is_property_method(mock_cst_module):
-    output = [is_property(method) for method in mock_cst_module.body[0].body.body]
-    assert len(output) == 10
-    assert sum(output) == 1
-    assert output[3]
-
-
-@pytest.mark.parametrize("script_path", ["basic"], indirect=True)
-def test_is_setter_method(mock_cst_module):
-    output = [is_setter(method) for method in mock_cst_module.body[0].body.body]
-    assert len(output) == 10
-    assert sum(output) == 1
-    assert output[4]
-
-
-@pytest.mark.parametrize("script_path", ["basic"], indirect=True)
-def test_is_getter_method(mock_cst_module):
-    output = [is_getter(method) for method in mock_cst_module.body[0].body.body]
-    assert len(output) == 10
-    assert sum(output) == 1
-    assert output[-1]
-
-
-@pytest.mark.parametrize("script_path", ["basic"], indirect=True)
-def test_get_function_name(mock_cst_module):
-    output = get_function_name_cst(mock_cst_module.body[0].body.body[0])
+def test_get_function_name(basic_methods):
+    output = get_function_name_cst(basic_methods[0])
     assert isinstance(output, str)
     assert output == "__init__"
 
 
-@pytest.mark.parametrize("script_path", ["attributes"], indirect=True)
-def test_is_unannotated_attribute(mock_cst_module):
-    output = [CST.is_class_attribute(method) for method in mock_cst_module.body[0].body.body]
+def test_is_unannotated_attribute(attributes_module):
+    output = [CST.is_class_attribute(method) for method in attributes_module.body[0].body.body]
     assert len(output) == 7
     assert sum(output) == 2
     assert output[1] and output[3]
 
 
-@pytest.mark.parametrize("script_path", ["attributes"], indirect=True)
-def test_is_annotated_attribute(mock_cst_module):
-    output = [CST.is_annotated_class_attribute(method) for method in mock_cst_module.body[0].body.body]
+def test_is_annotated_attribute(attributes_module):
+    output = [CST.is_annotated_class_attribute(method) for method in attributes_module.body[0].body.body]
     assert len(output) == 7
     assert sum(output) == 2
     assert output[0] and output[5]
 
 
-@pytest.mark.parametrize("script_path", ["attributes"], indirect=True)
-def test_get_annotated_attribute_name(mock_cst_module):
-    output = get_annotated_attribute_name_cst(mock_cst_module.body[0].body.body[0])
+def test_get_annotated_attribute_name(attributes_module):
+    output = get_annotated_attribute_name_cst(attributes_module.body[0].body.body[0])
     assert isinstance(output, str)
     assert output == "name"
 
 
-@pytest.mark.parametrize("script_path", ["attributes"], indirect=True)
-def test_get_attribute_name(mock_cst_module):
-    output = get_attribute_name_cst(mock_cst_module.body[0].body.body[1])
+def test_get_attribute_name(attributes_module):
+    output = get_attribute_name_cst(attributes_module.body[0].body.body[1])
     assert isinstance(output, str)
     assert output == "untyped_attribute"
 
 
-@pytest.mark.parametrize("script_path", ["docstrings_comments"], indirect=True)
-def test_is_class_docstring(mock_cst_module):
-    output = [is_class_docstring_cst(method) for method in mock_cst_module.body[1].body.body]
+def test_is_class_docstring(docstrings_comments_module):
+    output = [is_class_docstring_cst(method) for method in docstrings_comments_module.body[1].body.body]
     assert len(output) == 11
     assert sum(output) == 1
     assert output[0]
 
 
-@pytest.mark.parametrize("script_path", ["empty"], indirect=True)
-def test_is_ellipsis(mock_cst_module):
-    output = [is_ellipsis_cst(method) for method in mock_cst_module.body[1].body.body]
+def test_is_ellipsis(empty_module):
+    output = [is_ellipsis_cst(method) for method in empty_module.body[1].body.body]
     assert len(output) == 3
     assert sum(output) == 1
     assert output[0]
@@ -205,39 +199,33 @@ def test_extract_class_components_no_indentedblock():
         CST.extract_class_components(class_node=mock_obj)
 
 
-@pytest.mark.parametrize("script_path", ["auto_static"], indirect=True)
-def test_could_be_static_true(mock_cst_module, static_method_checker):
-    output = static_method_checker._check_for_static_cst(mock_cst_module.body[1].body.body[6])
+def test_could_be_static_true(auto_static_module, static_method_checker):
+    output = static_method_checker._check_for_static_cst(auto_static_module.body[1].body.body[6])
     assert output
 
 
-@pytest.mark.parametrize("script_path", ["auto_static"], indirect=True)
-def test_could_be_static_false(mock_cst_module, static_method_checker):
-    output = static_method_checker._check_for_static_cst(mock_cst_module.body[1].body.body[7])
+def test_could_be_static_false(auto_static_module, static_method_checker):
+    output = static_method_checker._check_for_static_cst(auto_static_module.body[1].body.body[7])
     assert not output
 
 
-@pytest.mark.parametrize("script_path", ["auto_static"], indirect=True)
-def test_could_be_static_false_multi(mock_cst_module, static_method_checker):
-    output = static_method_checker._check_for_static_cst(mock_cst_module.body[1].body.body[8])
+def test_could_be_static_false_multi(auto_static_module, static_method_checker):
+    output = static_method_checker._check_for_static_cst(auto_static_module.body[1].body.body[8])
     assert not output
 
 
-@pytest.mark.parametrize("script_path", ["auto_static"], indirect=True)
-def test_could_be_static_already_static(mock_cst_module, static_method_checker):
-    output = static_method_checker._check_for_static(mock_cst_module.body[1].body.body[9])
+def test_could_be_static_already_static(auto_static_module, static_method_checker):
+    output = static_method_checker._check_for_static(auto_static_module.body[1].body.body[9])
     assert not output
 
 
-@pytest.mark.parametrize("script_path", ["auto_static"], indirect=True)
-def test_could_be_static_abstract(mock_cst_module, static_method_checker):
-    output = static_method_checker._check_for_static(mock_cst_module.body[1].body.body[12])
+def test_could_be_static_abstract(auto_static_module, static_method_checker):
+    output = static_method_checker._check_for_static(auto_static_module.body[1].body.body[12])
     assert not output
 
 
-@pytest.mark.parametrize("script_path", ["auto_static"], indirect=True)
-def test_make_static_cst(mock_cst_module, static_method_checker):
-    output = static_method_checker._make_static_cst(mock_cst_module.body[1].body.body[6])
+def test_make_static_cst(auto_static_module, static_method_checker):
+    output = static_method_checker._make_static_cst(auto_static_module.body[1].body.body[6])
     assert isinstance(output, libcst.FunctionDef)
     assert len(output.decorators) == 1
     assert len(output.params.params) == 0
@@ -1,5 +1,5 @@
 import ast
-from unittest.mock import Mock
+from types import SimpleNamespace
 
 import libcst
 import pytest
@@ -15,22 +15,19 @@ from msort.decorators import has_decorator
 
 
 def test_decorator_call_id_attribute_error():
-    mock_decorator = Mock()
-    mock_decorator.func = "mocked function"
+    mock_decorator = SimpleNamespace(func="mocked function")
     with pytest.raises(AttributeError):
         decorator_call_id(mock_decorator)
 
 
 def test_decorator_name_id_attribute_error():
-    mock_decorator = Mock()
-    mock_decorator.decorator = "mocked decorator"
+    mock_decorator = SimpleNamespace(decorator="mocked decorator")
     with pytest.raises(AttributeError):
         decorator_name_id_cst(mock_decorator)
 
 
 def test_decorator_attribute_id_attribute_error():
-    mock_decorator = Mock()
-    mock_decorator.decorator = "mocked decorator"
+    mock_decorator = SimpleNamespace(decorator="mocked decorator")
     with pytest.raises(AttributeError):
         decorator_attribute_id_cst(mock_decorator)
 
@@ -46,15 +43,13 @@ def test_get_decorator_id():
 
 
 def test_get_decorator_id_cst():
-    mock_decorator = Mock()
-    mock_decorator.decorator = "mocked decorator"
+    mock_decorator = SimpleNamespace(decorator="mocked decorator")
     with pytest.raises(TypeError):
         get_decorator_id_cst(mock_decorator)
 
 
 def test_has_decorator_false():
-    mock_decorator = Mock()
-    mock_decorator.decorator = "mocked decorator"
+    mock_decorator = SimpleNamespace(decorator="mocked decorator")
     assert not has_decorator(mock_decorator, "mock")
 
 
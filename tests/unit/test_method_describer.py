@@ -1,6 +1,6 @@
 import ast
 import configparser
-from copy import deepcopy
+import functools
 from typing import Callable
 
 import pytest
@@ -10,21 +10,37 @@ from msort.method_describers import CSTMethodDescriber
 from msort.method_describers import get_method_describer
 
 
-@pytest.fixture
-def mock_config():
+MOCK_CONFIG = {
+    "msort.order": {
+        "dunder_method": "3",
+        "msort_group": "4",
+        "class_method": "5",
+        "static_method": "6",
+        "property": "7",
+        "decorated_method": "10",
+        "instance_method": "12",
+        "private_method": "13",
+    }
+}
+
+
+def build_mock_config() -> configparser.ConfigParser:
     config = configparser.ConfigParser()
-    config["msort.order"] = {}
-    config["msort.order"]["dunder_method"] = "3"
-    config["msort.order"]["msort_group"] = "4"
-    config["msort.order"]["class_method"] = "5"
-    config["msort.order"]["static_method"] = "6"
-    config["msort.order"]["property"] = "7"
-    config["msort.order"]["decorated_method"] = "10"
-    config["msort.order"]["instance_method"] = "12"
-    config["msort.order"]["private_method"] = "13"
+    config.read_dict(MOCK_CONFIG)
     return config
 
 
+@pytest.fixture
+def mock_config():
+    return build_mock_config()
+
+
+@functools.lru_cache(maxsize=None)
+def parse_function(func_code: str) -> ast.stmt:
+    # the source code fixtures are constant so each of them only needs parsing once per session
+    return ast.parse(func_code).body[0]
+
+
 @pytest.fixture
 def func_source_code():
     return "def func() -> int:\n    return 1"
@@ -55,6 +71,12 @@ def private_func(func_source_code):
     return func_source_code.replace("func", "_func")
 
 
+@pytest.fixture(scope="module")
+def ast_method_describer():
+    # the describer only reads its config after initialisation so one instance can be shared by the module
+    return ASTMethodDescriber(config=build_mock_config())
+
+
 def test_ast_method_describer_init(mock_config):
     describer = ASTMethodDescriber(config=mock_config)
     assert isinstance(describer._config, configparser.ConfigParser)
@@ -64,8 +86,8 @@ def test_ast_method_describer_init(mock_config):
     for func, value in describer._method_checking_map.items():
         assert isinstance(func, Callable)
         assert isinstance(value, int)
-    method_levels = list(describer._method_checking_map.values())
-    assert all(m in method_levels for m in list(map(int, list(mock_config["msort.order"].values()))))
+    method_levels = set(describer._method_checking_map.values())
+    assert set(map(int, mock_config["msort.order"].values())) <= method_levels
 
 
 def test_ast_method_describer__setup_func_to_level_map_valueerror(mock_config):
@@ -83,29 +105,24 @@ def test_ast_method_describer__setup_func_to_level_map_override(mock_config, cap
 
 
 def test_ast_method_describer_describe_method(
-    mock_config, func_source_code, static_func, class_func, cached_func, private_func, msort_group_func
+    ast_method_describer, func_source_code, static_func, class_func, cached_func, private_func, msort_group_func
 ):
-    describer = ASTMethodDescriber(config=deepcopy(mock_config))
-    for func_code, expected_value in zip(
-        [func_source_code, static_func, class_func, cached_func, private_func, msort_group_func],
-        [
-            mock_config["msort.order"]["instance_method"],
-            mock_config["msort.order"]["static_method"],
-            mock_config["msort.order"]["class_method"],
-            mock_config["msort.order"]["decorated_method"],
-            mock_config["msort.order"]["private_method"],
-            mock_config["msort.order"]["msort_group"],
-        ],
-    ):
-        node = ast.parse(func_code).body[0]
-        output = describer.get_method_type(node)
-        assert output == int(expected_value)
-
-
-def test_ast_method_describer_get_method_type_typeerror(mock_config):
-    describer = ASTMethodDescriber(config=mock_config)
+    levels = {method_type: int(level) for method_type, level in MOCK_CONFIG["msort.order"].items()}
+    cases = [
+        (func_source_code, levels["instance_method"]),
+        (static_func, levels["static_method"]),
+        (class_func, levels["class_method"]),
+        (cached_func, levels["decorated_method"]),
+        (private_func, levels["private_method"]),
+        (msort_group_func, levels["msort_group"]),
+    ]
+    for func_code, expected_level in cases:
+        assert ast_method_describer.get_method_type(parse_function(func_code)) == expected_level
+
+
+def test_ast_method_describer_get_method_type_typeerror(ast_method_describer):
     with pytest.raises(TypeError):
-        describer.get_method_type(method=1)
+        ast_method_describer.get_method_type(method=1)
 
 
 def test_get_method_describer(mock_config):
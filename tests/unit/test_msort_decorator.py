@@ -1,6 +1,13 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 from msort.msort_decorator import msort_group
 
+SRC_DIR = Path(__file__).resolve().parents[2].joinpath("src").as_posix()
+
 
 def my_func():
     return 1
@@ -53,3 +60,11 @@ def test_msort_group_static_method(caplog):
     output = msort_group(group="test")(my_class.my_static_func)()
     assert output == 1
     assert "Calling MyClass.my_static_func with msort_group : group = test" in caplog.messages
+
+
+def test_msort_group_import_does_not_load_libcst():
+    code = "import sys; from msort import msort_group; print('libcst' in sys.modules)"
+    # the child interpreter needs the source directory on its path as the package may not be installed
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [SRC_DIR, os.environ.get("PYTHONPATH")]))}
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env).stdout
+    assert output.strip() == "False"
@@ -1,5 +1,14 @@
+import ast
+
+import ast_comments
 import pytest
 from msort.utilities import check_and_get_attribute
+from msort.utilities import compile_skip_matcher
+from msort.utilities import extract_text_from_file
+from msort.utilities import is_class_docstring
+from msort.utilities import merge_code_strings
+from msort.utilities import remove_comment_nodes
+from msort.utilities import str_to_bool
 
 
 def test_check_attribute_success():
@@ -13,3 +22,97 @@ def test_check_attribute_fail():
 def test_check_attribute_exception():
     with pytest.raises(AttributeError):
         check_and_get_attribute(3, "lower", raise_exception=True)
+
+
+@pytest.mark.parametrize(
+    "code,expected",
+    [('"""docstring"""', True), ("'docstring'", True), ('b"bytes"', False), ('f"{x}"', False), ("x = 'a'", False)],
+)
+def test_is_class_docstring(code, expected):
+    assert is_class_docstring(ast.parse(code).body[0]) == expected
+
+
+@pytest.mark.parametrize(
+    "patterns,name,expected",
+    [
+        ([], "script", False),
+        (["test_"], "test_script", True),
+        (["test_", "_test"], "script_test", True),
+        (["test_", "_test"], "script", False),
+        (["a.b"], "axb", False),
+    ],
+)
+def test_compile_skip_matcher(patterns, name, expected):
+    assert compile_skip_matcher(patterns)(name) is expected
+
+
+def test_extract_text_from_file_newlines(tmp_path):
+    file_path = tmp_path / "script.py"
+    file_path.write_bytes(b"x = 1\r\ny = 2\rz = 3\n")
+    assert extract_text_from_file(file_path.as_posix()) == "x = 1\ny = 2\nz = 3\n"
+
+
+def test_extract_text_from_file(tmp_path):
+    file_path = tmp_path / "script.py"
+    file_path.write_bytes(b"x = 1\r\ny = 2\r\n")
+    assert extract_text_from_file(file_path.as_posix()) == "x = 1\ny = 2\n"
+    file_path.write_text("x = 12\n")
+    assert extract_text_from_file(file_path.as_posix()) == "x = 12\n"
+
+
+def test_merge_code_strings():
+    uncommented = "x = 1\n\ny = 2\n\n\nz = 3\n"
+    commented = "x = 1\n# comment\ny = 2\n# another comment\nz = 3\n"
+    expected = "x = 1\n# comment\n\ny = 2\n# another comment\n\n\nz = 3\n"
+    assert merge_code_strings(uncommented, commented) == expected
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("True", True),
+        ("false", False),
+        (" yes ", True),
+        ("0", False),
+        (True, True),
+        (False, False),
+        (1, True),
+        (0, False),
+    ],
+)
+def test_str_to_bool(value, expected):
+    assert str_to_bool(value) is expected
+
+
+@pytest.mark.parametrize("value", ["maybe", 1.0, None])
+def test_str_to_bool_valueerror(value):
+    with pytest.raises(ValueError):
+        str_to_bool(value)
+
+
+def test_remove_comment_nodes():
+    code = "# module comment\nclass MyClass:\n    # class comment\n    def func(self):\n        # func comment\n        return 1\n"
+    tree = remove_comment_nodes(ast_comments.parse(code))
+    assert not any(isinstance(node, ast_comments.Comment) for node in ast.walk(tree))
+    assert ast.unparse(tree) == ast.unparse(ast.parse(code))
+
+
+def test_remove_comment_nodes_nested_blocks():
+    code = (
+        "if x:\n    pass\nelse:\n    # else comment\n    pass\n"
+        "try:\n    pass\nexcept ValueError:\n    # handler comment\n    pass\nfinally:\n    # finally comment\n    pass\n"
+    )
+    tree = remove_comment_nodes(ast_comments.parse(code))
+    assert not any(isinstance(node, ast_comments.Comment) for node in ast.walk(tree))
+
+
+def test_remove_comment_nodes_restore():
+    code = "# module comment\nclass MyClass:\n    # class comment\n    def func(self):\n        return 1\n"
+    tree = ast_comments.parse(code)
+    expected = ast_comments.dump(tree)
+    removed = []
+    remove_comment_nodes(tree, removed)
+    assert len(removed) == 2
+    for body, original in removed:
+        body[:] = original
+    assert ast_comments.dump(tree) == expected